@@ -6,13 +6,42 @@ Scans notes/ folder structure and generates HTML pages for all topics.
 
 import re
 import os
+import io
+import gzip
+import json
+import hashlib
+import tarfile
+import argparse
+import datetime
+import subprocess
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+# Deployable parts of the site, relative to the repository root
+SITE_FILES = ['index.html', 'sitemap.xml', 'feed.xml', 'feed.json', 'src/filter.js']
+SITE_DIRS = ['pages', 'notes-html', 'assets']
+
+# Bump when the folder page layout changes so cached folder pages are rebuilt
+HUB_FORMAT_VERSION = 2
+
+# Source hashes and lastmod dates of published pages, relative to this script
+BUILD_MANIFEST = 'build-manifest.json'
+SITE_URL = 'https://qunlexie.github.io'
+SITE_AUTHOR = 'Olukunle O.'
 
 def parse_markdown_to_html(md_file):
     """Convert markdown file to HTML content with aman.ai-style table of contents"""
     with open(md_file, 'r', encoding='utf-8') as f:
         lines = f.readlines()
     
+    return parse_markdown_lines(lines)
+
+def parse_markdown_lines(lines):
+    """Convert markdown lines (as from readlines) to HTML content"""
     html_content = []
     toc_items = []
     
@@ -224,10 +253,19 @@ def get_file_title(md_file):
     except:
         return md_file.stem.replace('-', ' ').replace('_', ' ').title()
 
-def create_html_template(title, content, password):
+def get_cache_buster():
+    """Derive the stylesheet cache buster from the stylesheet content.
+
+    Pages only change when the CSS actually changes, so repeated builds
+    produce identical HTML and content-addressed deploys stay small.
+    """
+    style_file = Path(__file__).parent / '../assets/style.css'
+    return hashlib.sha256(style_file.read_bytes()).hexdigest()[:10]
+
+def create_html_template(title, content, password, cache_buster=None):
     """Create HTML template for a notes page with cache-busting"""
-    import time
-    cache_buster = int(time.time())
+    if cache_buster is None:
+        cache_buster = get_cache_buster()
     return f'''<!DOCTYPE html>
 <html lang="en">
   <head>
@@ -491,43 +529,18 @@ def create_html_template(title, content, password):
   </body>
 </html>'''
 
-def build_notes_hub(note_structure):
-    """Build the main notes hub page with simple table of contents format"""
-    
-    # Generate hub content
-    hub_content = []
-    
-    for folder_name, files in note_structure.items():
-        folder_title = folder_name.replace('-', ' ').replace('_', ' ').title()
-        hub_content.append(f'''
-          <div class="toc-section" id="{folder_name}">
-            <h2>{folder_title}</h2>
-            <ul class="toc-list">''')
-        
-        for file_info in files:
-            file_title = file_info['title']
-            file_name = file_info['name']
-            html_file = f"../notes-html/{folder_name}-{file_name}.html"
-            
-            hub_content.append(f'''
-              <li>
-                <a href="{html_file}">{file_title}</a>
-              </li>''')
-        
-        hub_content.append('''
-            </ul>
-          </div>''')
-    
-    # Create simple notes hub template
-    hub_template = '''<!DOCTYPE html>
-<html lang="en">
+def create_hub_template(content, heading='Notes Hub', subtitle='Study materials and technical notes',
+                        page_title='Notes Hub - Study Materials', extra_styles='', marker=''):
+    """Create HTML template for a hub page in pages/"""
+    return '''<!DOCTYPE html>
+''' + marker + '''<html lang="en">
   <head>
     <meta charset="UTF-8" />
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <meta http-equiv="Cache-Control" content="no-cache, no-store, must-revalidate">
     <meta http-equiv="Pragma" content="no-cache">
     <meta http-equiv="Expires" content="0">
-    <title>Notes Hub - Study Materials</title>
+    <title>''' + page_title + '''</title>
     <link rel="stylesheet" href="../assets/style.css" />
     <style>
       .notes-content { display: block; }
@@ -596,7 +609,7 @@ def build_notes_hub(note_structure):
         text-decoration: underline;
       }
       
-      @media (max-width: 768px) {
+''' + extra_styles + '''      @media (max-width: 768px) {
         .notes-header h1 {
           font-size: 2rem;
         }
@@ -622,12 +635,12 @@ def build_notes_hub(note_structure):
     <main>
       <div class="notes-content" id="notesContent">
         <div class="notes-header">
-          <h1>Notes Hub</h1>
-          <p class="subtitle">Study materials and technical notes</p>
+          <h1>''' + heading + '''</h1>
+          <p class="subtitle">''' + subtitle + '''</p>
         </div>
         
         <div class="toc-container">
-''' + ''.join(hub_content) + '''
+''' + content + '''
         </div>
       </div>
     </main>
@@ -641,6 +654,36 @@ def build_notes_hub(note_structure):
     </script>
   </body>
 </html>'''
+
+def build_notes_hub(note_structure):
+    """Build the main notes hub page with simple table of contents format"""
+    
+    # Generate hub content
+    hub_content = []
+    
+    for folder_name, files in note_structure.items():
+        folder_title = folder_name.replace('-', ' ').replace('_', ' ').title()
+        hub_content.append(f'''
+          <div class="toc-section" id="{folder_name}">
+            <h2>{folder_title}</h2>
+            <ul class="toc-list">''')
+        
+        for file_info in files:
+            file_title = file_info['title']
+            file_name = file_info['name']
+            html_file = f"../notes-html/{folder_name}-{file_name}.html"
+            
+            hub_content.append(f'''
+              <li>
+                <a href="{html_file}">{file_title}</a>
+              </li>''')
+        
+        hub_content.append('''
+            </ul>
+          </div>''')
+    
+    # Create simple notes hub template
+    hub_template = create_hub_template(''.join(hub_content))
     
     # Write the hub file
     script_dir = Path(__file__).parent
@@ -649,10 +692,637 @@ def build_notes_hub(note_structure):
     with open(hub_file, 'w', encoding='utf-8') as f:
         f.write(hub_template)
     
+    # Folder pages left over from a --paginated-hub build are no longer linked
+    remove_folder_pages(script_dir / '../pages')
+    
+    return True
+
+def folder_page_name(folder_name, page_number):
+    """File name (in pages/) of one page of a folder index"""
+    if page_number == 1:
+        return f"notes-{folder_name}.html"
+    return f"notes-{folder_name}.page-{page_number}.html"
+
+def git_modified_files(paths):
+    """Set of files under paths with uncommitted changes, or None without git"""
+    script_dir = Path(__file__).parent
+    try:
+        top_level = subprocess.run(
+            ['git', 'rev-parse', '--show-toplevel'], cwd=script_dir,
+            capture_output=True, text=True, check=True).stdout.strip()
+        modified = subprocess.run(
+            ['git', '-c', 'core.quotePath=false', 'diff', '--name-only', 'HEAD', '--']
+            + [str(Path(p).resolve()) for p in paths],
+            cwd=top_level, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {Path(top_level, line).resolve() for line in modified.splitlines()}
+
+def git_commit_times(paths):
+    """Map each file under paths to the unix time of the last commit touching it.
+
+    Uses a single git log call. Pass directories rather than individual
+    files, since git matches every commit against every path given. Files
+    with uncommitted changes are left out, as is everything when git or
+    the repository is unavailable, so callers fall back to file
+    modification times or the build time.
+    """
+    script_dir = Path(__file__).parent
+    try:
+        top_level = subprocess.run(
+            ['git', 'rev-parse', '--show-toplevel'], cwd=script_dir,
+            capture_output=True, text=True, check=True).stdout.strip()
+        log = subprocess.run(
+            ['git', '-c', 'core.quotePath=false', 'log', '--format=%x00%ct', '--name-only', '--']
+            + [str(Path(p).resolve()) for p in paths],
+            cwd=top_level, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+    modified = git_modified_files(paths) or set()
+    
+    commit_times = {}
+    commit_time = None
+    for line in log.splitlines():
+        if line.startswith('\0'):
+            commit_time = int(line[1:])
+        elif line and commit_time is not None:
+            # Newest commits come first, so keep the first time seen per file
+            commit_times.setdefault(Path(top_level, line).resolve(), commit_time)
+    for path in modified:
+        commit_times.pop(path, None)
+    return commit_times
+
+def site_commit_times():
+    """Last commit times for the notes sources and the site pages, for one build"""
+    site_root = Path(__file__).parent / '..'
+    return git_commit_times([site_root / 'notes', site_root / 'pages', site_root / 'index.html'])
+
+def source_timestamp(path, commit_times):
+    """Last-change time of a source file: its last commit, else its mtime"""
+    path = Path(path).resolve()
+    return commit_times.get(path, path.stat().st_mtime)
+
+def folder_digest(folder_name, files, page_size):
+    """Fingerprint everything a folder's index pages are rendered from"""
+    listing = [HUB_FORMAT_VERSION, folder_name, page_size,
+               [[f['name'], f['title']] for f in files]]
+    return hashlib.sha256(json.dumps(listing).encode('utf-8')).hexdigest()
+
+def read_page_marker(page_file):
+    """Return (folder, digest) from the marker on the second line of a folder page, if any"""
+    try:
+        with open(page_file, 'r', encoding='utf-8') as f:
+            f.readline()
+            match = re.match(r'<!-- notes-folder: (\S+) ([0-9a-f]+) -->', f.readline())
+    except OSError:
+        return None
+    return (match.group(1), match.group(2)) if match else None
+
+def remove_folder_pages(pages_dir, keep=()):
+    """Delete generated folder index pages, except those of folders in keep"""
+    for page_file in pages_dir.glob('notes-*.html'):
+        marker = read_page_marker(page_file)
+        if marker and marker[0] not in keep:
+            page_file.unlink()
+
+PAGINATED_HUB_STYLES = '''      .back-link {
+        display: inline-block;
+        margin-bottom: 1rem;
+        color: #007bff;
+        text-decoration: none;
+        font-weight: 500;
+      }
+      
+      .back-link:hover {
+        text-decoration: underline;
+      }
+      
+      .folder-summary {
+        color: #666;
+        font-size: 0.9rem;
+        margin: 0;
+      }
+      
+      .pagination {
+        display: flex;
+        justify-content: space-between;
+        margin-top: 2rem;
+        color: #666;
+      }
+      
+      .pagination a {
+        color: #007bff;
+        text-decoration: none;
+      }
+      
+'''
+
+def build_folder_pages(folder_name, files, page_size, pages_dir):
+    """Build the paginated index pages for one folder.
+
+    Returns the number of pages written, which is 0 when the pages on disk
+    were already rendered from the same listing.
+    """
+    page_count = max(1, -(-len(files) // page_size))
+    digest = folder_digest(folder_name, files, page_size)
+    page_files = [pages_dir / folder_page_name(folder_name, n) for n in range(1, page_count + 1)]
+    
+    # Pages left over from when the folder needed more of them
+    for page_file in pages_dir.glob(f"notes-{folder_name}.page-*.html"):
+        marker = read_page_marker(page_file)
+        if marker and marker[0] == folder_name and page_file not in page_files:
+            page_file.unlink()
+    
+    if all(read_page_marker(page_file) == (folder_name, digest) for page_file in page_files):
+        return 0
+    
+    folder_title = folder_name.replace('-', ' ').replace('_', ' ').title()
+    marker = f"<!-- notes-folder: {folder_name} {digest} -->\n"
+    
+    for page_number, page_file in enumerate(page_files, start=1):
+        start = (page_number - 1) * page_size
+        page_content = [f'''
+          <a href="notes.html" class="back-link">← Back to Notes Hub</a>
+          <div class="toc-section" id="{folder_name}">
+            <h2>{folder_title}</h2>
+            <ul class="toc-list">''']
+        
+        for file_info in files[start:start + page_size]:
+            html_file = f"../notes-html/{folder_name}-{file_info['name']}.html"
+            page_content.append(f'''
+              <li>
+                <a href="{html_file}">{file_info['title']}</a>
+              </li>''')
+        
+        page_content.append('''
+            </ul>
+          </div>''')
+        
+        if page_count > 1:
+            previous_link = next_link = '<span></span>'
+            if page_number > 1:
+                previous_link = f'<a href="{folder_page_name(folder_name, page_number - 1)}">← Previous</a>'
+            if page_number < page_count:
+                next_link = f'<a href="{folder_page_name(folder_name, page_number + 1)}">Next →</a>'
+            page_content.append(f'''
+          <div class="pagination">
+            {previous_link}
+            <span>Page {page_number} of {page_count}</span>
+            {next_link}
+          </div>''')
+        
+        page_template = create_hub_template(
+            ''.join(page_content),
+            heading=folder_title,
+            subtitle=f"{len(files)} notes",
+            page_title=f"{folder_title} - Notes Hub",
+            extra_styles=PAGINATED_HUB_STYLES,
+            marker=marker)
+        
+        with open(page_file, 'w', encoding='utf-8') as f:
+            f.write(page_template)
+    
+    return page_count
+
+def build_paginated_hub(note_structure, page_size=50, recent_count=10, commit_times=None):
+    """Build a compact notes hub that links to paginated per-folder index pages.
+
+    The hub only lists folder summaries and the most recently updated notes,
+    so its size depends on the number of folders rather than notes. Folder
+    pages are rewritten only when that folder's listing changes.
+    commit_times is the build's git_commit_times map, looked up if omitted.
+    """
+    script_dir = Path(__file__).parent
+    pages_dir = script_dir / '../pages'
+    page_size = max(1, page_size)
+    
+    hub_content = ['''
+          <div class="toc-section" id="folders">
+            <h2>Folders</h2>
+            <ul class="toc-list">''']
+    recent = []
+    written_pages = 0
+    
+    if commit_times is None:
+        commit_times = site_commit_times()
+    
+    for folder_name, files in note_structure.items():
+        # Sorted so page contents and digests do not depend on glob() order
+        files = sorted(files, key=lambda f: (f['title'].lower(), f['name']))
+        written_pages += build_folder_pages(folder_name, files, page_size, pages_dir)
+        
+        folder_title = folder_name.replace('-', ' ').replace('_', ' ').title()
+        updated = [(source_timestamp(f['file'], commit_times), folder_name, f['name'], f) for f in files]
+        recent.extend(updated)
+        
+        summary = f"{len(files)} notes"
+        if updated:
+            last_updated = datetime.datetime.fromtimestamp(max(u[0] for u in updated), datetime.timezone.utc)
+            summary += f" · updated {last_updated.date().isoformat()}"
+        
+        hub_content.append(f'''
+              <li>
+                <a href="{folder_page_name(folder_name, 1)}">{folder_title}</a>
+                <p class="folder-summary">{summary}</p>
+              </li>''')
+    
+    hub_content.append('''
+            </ul>
+          </div>''')
+    
+    if recent:
+        recent.sort(key=lambda u: u[:3], reverse=True)
+        hub_content.append('''
+          <div class="toc-section" id="recently-updated">
+            <h2>Recently Updated</h2>
+            <ul class="toc-list">''')
+        for _, folder_name, _, file_info in recent[:recent_count]:
+            html_file = f"../notes-html/{folder_name}-{file_info['name']}.html"
+            hub_content.append(f'''
+              <li>
+                <a href="{html_file}">{file_info['title']}</a>
+              </li>''')
+        hub_content.append('''
+            </ul>
+          </div>''')
+    
+    hub_template = create_hub_template(''.join(hub_content), extra_styles=PAGINATED_HUB_STYLES)
+    
+    with open(pages_dir / 'notes.html', 'w', encoding='utf-8') as f:
+        f.write(hub_template)
+    
+    # Index pages of folders that no longer exist
+    remove_folder_pages(pages_dir, keep=note_structure)
+    
+    return written_pages
+
+def summarize_note(md_content, max_topics=5):
+    """One-line summary of a note listing its first main topics"""
+    topics = [line[2:].strip() for line in md_content.splitlines()
+              if line.startswith('- ') and line[2:].strip()]
+    summary = ', '.join(topics[:max_topics])
+    if len(topics) > max_topics:
+        summary += f" and {len(topics) - max_topics} more"
+    return summary
+
+def read_note(md_file):
+    """Read a markdown source file, returning its text"""
+    with open(md_file, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def write_behind(write_queue, errors):
+    """Drain (path, text) pairs from write_queue until a None sentinel.
+
+    After the first failure the remaining pages are skipped, but the queue
+    keeps draining so the producer never blocks on a dead writer.
+    """
+    while True:
+        item = write_queue.get()
+        try:
+            if item is None:
+                return
+            if errors:
+                continue
+            path, text = item
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            write_queue.task_done()
+
+def run_build_pipeline(jobs, cache_buster, read_workers=4, queue_size=8):
+    """Read, parse and write note pages as an overlapped pipeline.
+
+    Reads are prefetched by a thread pool, parsing runs on the calling
+    thread in job order, and pages are flushed by a write-behind thread.
+    Both ends are bounded: at most read_workers * 2 reads are in flight,
+    and parsing blocks on the write queue when writes fall behind. A write
+    failure stops the build before the next page is queued. Every page
+    has been written when this returns, so the hub and the summary are
+    only built after all outputs are on disk.
+    """
+    write_queue = queue.Queue(maxsize=max(1, queue_size))
+    write_errors = []
+    writer = threading.Thread(target=write_behind, args=(write_queue, write_errors), daemon=True)
+    writer.start()
+    
+    generated_files = []
+    current_folder = None
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, read_workers)) as pool:
+            # Sliding window of prefetched reads, refilled as each one is used
+            prefetch = max(1, read_workers) * 2
+            reads = deque(pool.submit(read_note, file_info['file']) for _, file_info, _ in jobs[:prefetch])
+            
+            for index, (folder_name, file_info, html_file) in enumerate(jobs):
+                read = reads.popleft()
+                if index + prefetch < len(jobs):
+                    reads.append(pool.submit(read_note, jobs[index + prefetch][1]['file']))
+                
+                if folder_name != current_folder:
+                    print(f"\n📚 Processing {folder_name}...")
+                    current_folder = folder_name
+                
+                file_title = file_info['title']
+                print(f"  📄 {file_title} -> {html_file}")
+                
+                md_content = read.result()
+                file_info['sha256'] = hashlib.sha256(md_content.encode('utf-8')).hexdigest()
+                file_info['summary'] = summarize_note(md_content)
+                
+                # Check if markdown file has enough content
+                if len(md_content.strip()) < 100:
+                    print(f"    ⚠️  Warning: {file_title} seems too short!")
+                    continue
+                
+                # Parse markdown to HTML
+                html_content = parse_markdown_lines(io.StringIO(md_content).readlines())
+                
+                # Queue the page for the write-behind thread
+                html_template = create_html_template(file_title, html_content, None, cache_buster)
+                if write_errors:
+                    raise write_errors[0]
+                write_queue.put((html_file, html_template))
+                
+                generated_files.append(html_file)
+                print(f"    ✅ Generated {len(html_content)} characters")
+    finally:
+        write_queue.put(None)
+        writer.join()
+    
+    if write_errors:
+        raise write_errors[0]
+    
+    return generated_files
+
+def collect_site_files():
+    """Map every deployable site file (relative posix path) to its absolute path"""
+    site_root = (Path(__file__).parent / '..').resolve()
+    site_files = {}
+    
+    for name in SITE_FILES:
+        path = site_root / name
+        if path.is_file():
+            site_files[name] = path
+    
+    for name in SITE_DIRS:
+        folder = site_root / name
+        if not folder.is_dir():
+            continue
+        for path in sorted(folder.rglob('*')):
+            if path.is_file() and not path.name.startswith('.'):
+                site_files[path.relative_to(site_root).as_posix()] = path
+    
+    return site_files
+
+def build_manifest(site_files):
+    """Hash all site files into a manifest of path -> {sha256, size}"""
+    files = {}
+    for rel_path, path in sorted(site_files.items()):
+        data = path.read_bytes()
+        files[rel_path] = {
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'size': len(data)
+        }
+    return {'version': 1, 'files': files}
+
+def diff_manifests(previous, current):
+    """Compare two manifests and return (added, changed, deleted) path lists"""
+    old_files = previous.get('files', {})
+    new_files = current['files']
+    
+    added = sorted(p for p in new_files if p not in old_files)
+    changed = sorted(p for p in new_files
+                     if p in old_files and old_files[p]['sha256'] != new_files[p]['sha256'])
+    deleted = sorted(p for p in old_files if p not in new_files)
+    return added, changed, deleted
+
+def write_bundle(bundle_dir, delta_from=None):
+    """Pack the site into a content-addressed archive plus a manifest.
+
+    Blobs are stored once under blobs/<sha256>, however many paths share
+    them. With delta_from, only blobs the previous release does not already
+    have are packed; the manifest lists them under delta.blobs next to the
+    added, changed and deleted paths.
+    """
+    bundle_dir = Path(bundle_dir)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    
+    site_files = collect_site_files()
+    manifest = build_manifest(site_files)
+    known_blobs = set()
+    
+    if delta_from:
+        with open(delta_from, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        known_blobs = {entry['sha256'] for entry in previous.get('files', {}).values()}
+        added, changed, deleted = diff_manifests(previous, manifest)
+        manifest['delta'] = {
+            'added': added,
+            'changed': changed,
+            'deleted': deleted
+        }
+    
+    # One path per blob the host does not have yet, in path order
+    upload = {}
+    for rel_path, entry in sorted(manifest['files'].items()):
+        if entry['sha256'] not in known_blobs:
+            upload.setdefault(entry['sha256'], rel_path)
+    
+    if delta_from:
+        manifest['delta']['blobs'] = sorted(upload)
+    
+    manifest_bytes = json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8')
+    
+    # Fixed mtimes keep the archive byte-identical for identical content
+    archive_file = bundle_dir / 'bundle.tar.gz'
+    with open(archive_file, 'wb') as raw, \
+         gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as gz, \
+         tarfile.open(fileobj=gz, mode='w') as tar:
+        for digest, rel_path in sorted(upload.items()):
+            data = site_files[rel_path].read_bytes()
+            info = tarfile.TarInfo(f"blobs/{digest}")
+            info.size = len(data)
+            info.mtime = 0
+            tar.addfile(info, io.BytesIO(data))
+        
+        info = tarfile.TarInfo('manifest.json')
+        info.size = len(manifest_bytes)
+        info.mtime = 0
+        tar.addfile(info, io.BytesIO(manifest_bytes))
+    
+    manifest_file = bundle_dir / 'manifest.json'
+    with open(manifest_file, 'wb') as f:
+        f.write(manifest_bytes)
+    
+    return archive_file, manifest_file, manifest, len(upload)
+
+def load_build_manifest():
+    """Load the source manifest (site path -> source hash, lastmod, title) from the last build"""
+    manifest_file = Path(__file__).parent / BUILD_MANIFEST
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'version': 1, 'entries': {}}
+
+def format_lastmod(timestamp):
+    """Format a unix time as a UTC W3C datetime"""
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def update_build_manifest(manifest, sources, commit_times):
+    """Merge this build's sources into the manifest.
+
+    sources maps a site path to (sha256, title, source file, summary). An
+    entry's lastmod only moves when its source hash changes, so rebuilding
+    unchanged notes leaves it alone. New entries are dated from their
+    source's last git commit in commit_times, falling back to the build
+    time when git has no clean record of the file. Returns the site paths
+    that were added or changed.
+    """
+    now = format_lastmod(datetime.datetime.now(datetime.timezone.utc).timestamp())
+    old_entries = manifest.get('entries', {})
+    entries = {}
+    changed = []
+    
+    for site_path, (digest, title, source, summary) in sorted(sources.items()):
+        entry = old_entries.get(site_path)
+        if entry and entry['sha256'] == digest:
+            entries[site_path] = dict(entry, title=title)
+        else:
+            lastmod = now
+            commit_time = commit_times.get(Path(source).resolve())
+            if not entry and commit_time is not None:
+                lastmod = format_lastmod(commit_time)
+            entries[site_path] = {'sha256': digest, 'lastmod': lastmod, 'title': title}
+            changed.append(site_path)
+        if summary:
+            entries[site_path]['summary'] = summary
+    
+    manifest['entries'] = entries
+    return changed
+
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds exactly that text"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
     return True
 
+def render_sitemap(entries, site_url):
+    """Render sitemap.xml from manifest entries"""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for site_path, entry in sorted(entries.items()):
+        lines.append(f'  <url><loc>{escape(site_url + "/" + site_path)}</loc>'
+                     f'<lastmod>{entry["lastmod"]}</lastmod></url>')
+    lines.append('</urlset>')
+    return '\n'.join(lines) + '\n'
+
+def render_feeds(entries, site_url, limit=20):
+    """Render the Atom and JSON feeds of the most recently changed notes"""
+    notes = sorted(((path, entry) for path, entry in entries.items() if path.startswith('notes-html/')),
+                   key=lambda item: (item[1]['lastmod'], item[0]), reverse=True)[:limit]
+    updated = notes[0][1]['lastmod'] if notes else '1970-01-01T00:00:00Z'
+    
+    atom = ['<?xml version="1.0" encoding="UTF-8"?>',
+            '<feed xmlns="http://www.w3.org/2005/Atom">',
+            '  <title>Notes Hub - Recently Updated</title>',
+            f'  <id>{escape(site_url)}/feed.xml</id>',
+            f'  <link rel="self" href="{escape(site_url)}/feed.xml"/>',
+            f'  <link href="{escape(site_url)}/pages/notes.html"/>',
+            f'  <author><name>{escape(SITE_AUTHOR)}</name></author>',
+            f'  <updated>{updated}</updated>']
+    items = []
+    for site_path, entry in notes:
+        url = f"{site_url}/{site_path}"
+        summary = entry.get('summary') or entry['title']
+        atom.append(f'  <entry><title>{escape(entry["title"])}</title><link href="{escape(url)}"/>'
+                    f'<id>{escape(url)}</id><updated>{entry["lastmod"]}</updated>'
+                    f'<summary>{escape(summary)}</summary></entry>')
+        items.append({'id': url, 'url': url, 'title': entry['title'],
+                      'date_modified': entry['lastmod'], 'summary': summary, 'content_text': summary})
+    atom.append('</feed>')
+    
+    json_feed = {
+        'version': 'https://jsonfeed.org/version/1.1',
+        'title': 'Notes Hub - Recently Updated',
+        'home_page_url': f"{site_url}/pages/notes.html",
+        'feed_url': f"{site_url}/feed.json",
+        'authors': [{'name': SITE_AUTHOR}],
+        'items': items
+    }
+    return '\n'.join(atom) + '\n', json.dumps(json_feed, indent=2) + '\n'
+
+def build_sitemap_and_feeds(note_sources, site_url, commit_times=None):
+    """Update the build manifest, sitemap.xml and the recently-changed feeds.
+
+    note_sources maps generated note pages to (markdown sha256, title,
+    markdown file, summary); the other site pages are hashed as they are.
+    commit_times is the build's git_commit_times map, looked up if omitted.
+    Each output file is only rewritten when one of its entries changed.
+    """
+    site_root = Path(__file__).parent / '..'
+    site_url = site_url.rstrip('/')
+    
+    sources = dict(note_sources)
+    for site_path, path in collect_site_files().items():
+        if site_path.endswith('.html') and not site_path.startswith('notes-html/'):
+            sources[site_path] = (hashlib.sha256(path.read_bytes()).hexdigest(), path.stem, path, None)
+    
+    if commit_times is None:
+        commit_times = site_commit_times()
+    else:
+        # The hub may have rewritten pages/ since commit_times was taken
+        commit_times = dict(commit_times)
+        for path in git_modified_files([site_root / 'pages']) or ():
+            commit_times.pop(path, None)
+    
+    manifest = load_build_manifest()
+    changed = update_build_manifest(manifest, sources, commit_times)
+    entries = manifest['entries']
+    
+    write_if_changed(Path(__file__).parent / BUILD_MANIFEST,
+                     json.dumps(manifest, indent=2, sort_keys=True) + '\n')
+    write_if_changed(site_root / 'sitemap.xml', render_sitemap(entries, site_url))
+    atom_feed, json_feed = render_feeds(entries, site_url)
+    write_if_changed(site_root / 'feed.xml', atom_feed)
+    write_if_changed(site_root / 'feed.json', json_feed)
+    
+    return changed
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description='Build the notes site from notes/ markdown files.')
+    parser.add_argument('--jobs', type=int, default=4, metavar='N',
+                        help='number of threads prefetching markdown sources (default: 4)')
+    parser.add_argument('--write-queue', type=int, default=8, metavar='N',
+                        help='pages buffered for the write-behind thread (default: 8)')
+    parser.add_argument('--paginated-hub', action='store_true',
+                        help='build a compact hub with paginated per-folder index pages')
+    parser.add_argument('--hub-page-size', type=int, default=50, metavar='N',
+                        help='notes per folder index page with --paginated-hub (default: 50)')
+    parser.add_argument('--site-url', default=SITE_URL, metavar='URL',
+                        help=f'base URL used in sitemap.xml and the feeds (default: {SITE_URL})')
+    parser.add_argument('--bundle', metavar='DIR',
+                        help='also pack the site into DIR/bundle.tar.gz with DIR/manifest.json')
+    parser.add_argument('--delta-from', metavar='MANIFEST',
+                        help='with --bundle, only pack files added or changed since MANIFEST')
+    args = parser.parse_args()
+    if args.delta_from and not args.bundle:
+        parser.error('--delta-from requires --bundle')
+    return args
+
 def main():
     """Main function"""
+    args = parse_args()
+    
     print("🔍 Discovering note folders...")
     note_structure = discover_note_folders()
     
@@ -669,54 +1339,56 @@ def main():
     output_dir = script_dir / '../notes-html'
     output_dir.mkdir(exist_ok=True)
     
-    generated_files = []
-    
-    # Process each folder
+    # Flatten in discovery order; this is the order of the build summary
+    jobs = []
     for folder_name, files in note_structure.items():
-        print(f"\n📚 Processing {folder_name}...")
-        
         for file_info in files:
-            md_file = file_info['file']
-            file_title = file_info['title']
-            file_name = file_info['name']
-            html_file = output_dir / f"{folder_name}-{file_name}.html"
-            
-            print(f"  📄 {file_title} -> {html_file}")
-            
-            # Check if markdown file has enough content
-            with open(md_file, 'r', encoding='utf-8') as f:
-                md_content = f.read()
-            
-            if len(md_content.strip()) < 100:
-                print(f"    ⚠️  Warning: {file_title} seems too short!")
-                continue
-            
-            # Parse markdown to HTML
-            html_content = parse_markdown_to_html(md_file)
-            
-            # Create HTML file
-            html_template = create_html_template(file_title, html_content, None)
-            
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(html_template)
-            
-            generated_files.append(html_file)
-            print(f"    ✅ Generated {len(html_content)} characters")
+            html_file = output_dir / f"{folder_name}-{file_info['name']}.html"
+            jobs.append((folder_name, file_info, html_file))
+    
+    # The stylesheet is hashed once per build, not once per page
+    generated_files = run_build_pipeline(jobs, get_cache_buster(), args.jobs, args.write_queue)
     
     # Build notes hub
     print(f"\n🏠 Building notes hub...")
-    if build_notes_hub(note_structure):
+    # One git log for the whole build, shared by the hub and the sitemap
+    commit_times = site_commit_times()
+    if args.paginated_hub:
+        written_pages = build_paginated_hub(note_structure, args.hub_page_size, commit_times=commit_times)
+        print(f"✅ Successfully updated notes hub! ({written_pages} folder pages rewritten)")
+    elif build_notes_hub(note_structure):
         print("✅ Successfully updated notes hub!")
     else:
         print("❌ Failed to update notes hub")
         return
     
+    # Sitemap and feeds, from the source hashes recorded by the pipeline
+    print(f"\n🗺️  Updating sitemap and feeds...")
+    generated = set(generated_files)
+    note_sources = {
+        f"notes-html/{html_file.name}": (file_info['sha256'], file_info['title'],
+                                         file_info['file'], file_info['summary'])
+        for _, file_info, html_file in jobs if html_file in generated
+    }
+    changed = build_sitemap_and_feeds(note_sources, args.site_url, commit_times)
+    print(f"✅ {len(changed)} sitemap entries added or changed")
+    
     print(f"\n🎉 Build complete!")
     print(f"Generated {len(generated_files)} HTML files:")
     for file in generated_files:
         print(f"  📄 {file}")
     print(f"  🏠 notes.html (hub)")
     
+    if args.bundle:
+        print(f"\n📦 Packing deploy bundle...")
+        archive_file, manifest_file, manifest, blob_count = write_bundle(args.bundle, args.delta_from)
+        print(f"  📦 {archive_file} ({blob_count} blobs for {len(manifest['files'])} files)")
+        print(f"  🧾 {manifest_file}")
+        if 'delta' in manifest:
+            delta = manifest['delta']
+            print(f"  ➕ {len(delta['added'])} added, ✏️  {len(delta['changed'])} changed, "
+                  f"➖ {len(delta['deleted'])} deleted")
+    
     print(f"\nNext steps:")
     print(f"1. Open notes.html in browser to preview")
     print(f"2. If it looks good, commit all HTML files")